@@ -0,0 +1,1037 @@
+"""
+Sdílený vykreslovací modul pro prohlížeč modelu Head1919.
+Obsahuje načítání OBJ souborů s binární cache, optimalizace rozložení
+sítě (Mortonovo prostorové seřazení, Forsythova optimalizace pro vertex
+cache, kvantizace souřadnic), shaderové vykreslování, kameru a textový
+HUD. Jednotlivé skripty (main.py, main-snap*.py) jsou jen tenké obálky,
+které volají run() se svou konfigurací barev, režimu vykreslování
+a rozložení kláves.
+"""
+
+import pygame
+from pygame.locals import *
+from OpenGL.GL import *
+import ctypes
+import math
+import mmap
+import os
+import re
+from collections import namedtuple
+
+import numpy as np
+
+# Numba je volitelná závislost: pokud je k dispozici, trianguluje se
+# smíšený seznam obličejů JIT-kompilovanou smyčkou místo seskupování
+# v Pythonu
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+# Nahraný model: VAO se zapamatovaným nastavením bufferů, počet indexů
+# (či vrcholů u neindexované sítě), dekvantizační transformace
+# kvantizovaných souřadnic, příznak indexovaného vykreslení, jednotná
+# barva (None, pokud má síť vlastní pole barev) a prostorové bloky
+# indexů pro frustum culling (None, pokud se síť kreslí vcelku)
+Model = namedtuple("Model", ["vao", "count", "bias", "scale", "indexed",
+                             "color", "sub_meshes"])
+
+# Prostorové bloky sdílející jeden index buffer: offsety a počty indexů
+# jednotlivých bloků a jejich AABB v kvantizovaném prostoru modelu
+SubMeshes = namedtuple("SubMeshes", ["offsets", "counts", "aabb_min", "aabb_max"])
+
+# Počet prostorových bloků, na které se indexovaná síť dělí
+SUB_MESH_COUNT = 64
+
+# Slinkovaný shaderový program a umístění jeho uniformů
+Shader = namedtuple("Shader", ["program", "mvp_loc"])
+
+# Rozložení kláves kamery: akce bez přiřazené klávesy má hodnotu None
+CameraKeys = namedtuple("CameraKeys", ["forward", "back", "up", "down",
+                                       "left", "right"])
+
+# Výchozí rozložení: W/S vpřed a vzad, Q/E nahoru a dolů, A/D do stran
+KEYS_WASD_QE = CameraKeys(pygame.K_w, pygame.K_s, pygame.K_q, pygame.K_e,
+                          pygame.K_a, pygame.K_d)
+
+# Rozložení snap skriptů: A/D ovládá pohyb nahoru a dolů
+KEYS_WASD = CameraKeys(pygame.K_w, pygame.K_s, pygame.K_a, pygame.K_d,
+                       None, None)
+
+# Paleta harmonických, tlumených barev pro režim colors="palette"
+# (hodnoty RGB v rozsahu 0.0 až 1.0)
+PALETTE = np.array([
+    (0.70, 0.50, 0.30),  # teplý zemitý tón
+    (0.60, 0.55, 0.45),  # jemná béžová
+    (0.65, 0.60, 0.50),  # tlumená olivová
+    (0.55, 0.55, 0.65),  # chladná šedomodrá
+    (0.60, 0.70, 0.60),  # jemná zelená
+], dtype=np.float32)
+
+# Jednotná zelená barva pro režim colors="green"
+GREEN = (0.2, 0.6, 0.2)
+
+# Minimální dvojice shaderů: vrcholy se transformují jedinou maticí MVP
+# spočítanou na CPU, barva přichází atributem - buď z pole barev, nebo
+# jako konstantní hodnota nastavená přes glVertexAttrib3f. Oproti fixní
+# pipeline tak ovladač nemusí za běhu syntetizovat shader podle stavu.
+VERTEX_SHADER_SOURCE = """
+#version 120
+attribute vec3 position;
+attribute vec3 color;
+uniform mat4 mvp;
+varying vec3 v_color;
+void main() {
+    gl_Position = mvp * vec4(position, 1.0);
+    v_color = color;
+}
+"""
+
+FRAGMENT_SHADER_SOURCE = """
+#version 120
+varying vec3 v_color;
+void main() {
+    gl_FragColor = vec4(v_color, 1.0);
+}
+"""
+
+
+def compile_shader(source, shader_type):
+    """
+    Zkompiluje jeden shader a při chybě vyhodí výjimku s logem překladače.
+    """
+    shader = glCreateShader(shader_type)
+    glShaderSource(shader, source)
+    glCompileShader(shader)
+    if not glGetShaderiv(shader, GL_COMPILE_STATUS):
+        raise RuntimeError(glGetShaderInfoLog(shader).decode())
+    return shader
+
+
+def create_shader():
+    """
+    Sestaví a slinkuje shaderový program pro vykreslení modelu
+    a vrátí jej spolu s umístěním uniformu mvp.
+    """
+    vertex_shader = compile_shader(VERTEX_SHADER_SOURCE, GL_VERTEX_SHADER)
+    fragment_shader = compile_shader(FRAGMENT_SHADER_SOURCE, GL_FRAGMENT_SHADER)
+
+    program = glCreateProgram()
+    glAttachShader(program, vertex_shader)
+    glAttachShader(program, fragment_shader)
+    glBindAttribLocation(program, 0, b"position")
+    glBindAttribLocation(program, 1, b"color")
+    glLinkProgram(program)
+    if not glGetProgramiv(program, GL_LINK_STATUS):
+        raise RuntimeError(glGetProgramInfoLog(program).decode())
+    glDeleteShader(vertex_shader)
+    glDeleteShader(fragment_shader)
+
+    return Shader(program, glGetUniformLocation(program, b"mvp"))
+
+
+def perspective_matrix(fov, aspect, near, far):
+    """
+    Sestaví projekční matici perspektivy (shodnou s gluPerspective)
+    jako pole NumPy 4x4.
+    """
+    f = 1.0 / math.tan(math.radians(fov) / 2)
+    matrix = np.zeros((4, 4), dtype=np.float32)
+    matrix[0, 0] = f / aspect
+    matrix[1, 1] = f
+    matrix[2, 2] = (far + near) / (near - far)
+    matrix[2, 3] = 2 * far * near / (near - far)
+    matrix[3, 2] = -1.0
+    return matrix
+
+
+def look_at_matrix(eye):
+    """
+    Sestaví pohledovou matici kamery v bodě eye dívající se na střed
+    (0, 0, 0) s osou Y nahoru (shodnou s gluLookAt).
+    """
+    eye = np.asarray(eye, dtype=np.float32)
+    forward = -eye / np.linalg.norm(eye)
+    side = np.cross(forward, np.array([0.0, 1.0, 0.0], dtype=np.float32))
+    side /= np.linalg.norm(side)
+    up = np.cross(side, forward)
+
+    matrix = np.eye(4, dtype=np.float32)
+    matrix[0, :3] = side
+    matrix[1, :3] = up
+    matrix[2, :3] = -forward
+    matrix[:3, 3] = -matrix[:3, :3] @ eye
+    return matrix
+
+
+def ortho_matrix(width, height):
+    """
+    Sestaví ortografickou projekci 1:1 s pixely okna
+    (shodnou s gluOrtho2D(0, width, 0, height)).
+    """
+    matrix = np.eye(4, dtype=np.float32)
+    matrix[0, 0] = 2.0 / width
+    matrix[1, 1] = 2.0 / height
+    matrix[2, 2] = -1.0
+    matrix[0, 3] = -1.0
+    matrix[1, 3] = -1.0
+    return matrix
+
+
+def dequantize_matrix(model):
+    """
+    Sestaví modelovou matici, která převádí kvantizované int16
+    souřadnice zpět do světových jednotek (posun a měřítko z AABB).
+    """
+    matrix = np.eye(4, dtype=np.float32)
+    matrix[0, 0] = model.scale[0] / 32767
+    matrix[1, 1] = model.scale[1] / 32767
+    matrix[2, 2] = model.scale[2] / 32767
+    matrix[:3, 3] = model.bias
+    return matrix
+
+
+def load_obj(filename):
+    """
+    Načte soubor .obj a vrátí pole vrcholů a indexů obličejů.
+    Soubor se namapuje do paměti přes mmap, takže parser čte přímo
+    z page cache a nevytváří kopii celého souboru v Pythonu. Řádky
+    s definicemi vrcholů (v) a obličejů (f) vybere regex nad mapovanou
+    oblastí a čísla se převedou jediným reshape + astype v C místo
+    interpretované smyčky po řádcích. Soubory s proměnlivým počtem
+    sloupců se zpracují záložní cestou po řádcích.
+    Tento jednoduchý parser očekává, že soubor obsahuje pouze definice
+    vrcholů (v) a obličejů (f); případné normály a texturovací
+    koeficienty v zápisu obličeje (např. "1/2/3") jsou zahozeny.
+
+    Výsledek parsování se ukládá do binární cache vedle zdrojového
+    souboru (model.obj.npz); při dalších spuštěních se místo tokenizace
+    ASCII načtou hotová pole přes np.load s mmap_mode, takže start
+    trvá milisekundy nezávisle na velikosti modelu.
+    """
+    cache = filename + ".npz"
+    if os.path.exists(cache) and os.path.getmtime(cache) >= os.path.getmtime(filename):
+        archive = np.load(cache, mmap_mode="r")
+        return archive["v"], archive["f"]
+
+    with open(filename, "rb") as file:
+        mm = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            # Regex běží přímo nad mapovanými bajty; zkopírují se jen
+            # nalezené "v" a "f" řádky, nikoli celý soubor
+            v_lines = re.findall(rb"^v .*$", mm, re.MULTILINE)
+            f_lines = re.findall(rb"^f .*$", mm, re.MULTILINE)
+        finally:
+            mm.close()
+
+    # Vrcholy: všechny tokeny najednou; pokud mají řádky jednotný počet
+    # sloupců, převede je jediný astype, jinak čteme po řádcích
+    v_tokens = b" ".join(v_lines).split()
+    v_width = len(v_lines[0].split()) if v_lines else 0
+    if v_lines and len(v_tokens) == len(v_lines) * v_width:
+        vertices = np.array(v_tokens).reshape(-1, v_width)[:, 1:4].astype(np.float32)
+    else:
+        vertices = np.array([list(map(float, line.split()[1:4])) for line in v_lines],
+                            dtype=np.float32)
+
+    # Obličeje: případné "/vt/vn" části odstraníme jedním průchodem regexu
+    f_blob = b"\n".join(f_lines)
+    if b"/" in f_blob:
+        f_blob = re.sub(rb"/\S*", b"", f_blob)
+    f_tokens = f_blob.split()
+    f_width = len(f_lines[0].split()) if f_lines else 0
+    if f_lines and len(f_tokens) == len(f_lines) * f_width:
+        # Indexy v souboru OBJ začínají od 1, proto odečítáme 1
+        faces = np.array(f_tokens).reshape(-1, f_width)[:, 1:].astype(np.uint32) - 1
+    else:
+        # Záložní cesta pro obličeje s různým počtem vrcholů
+        faces = [[int(p.split(b"/")[0]) - 1 for p in line.split()[1:]]
+                 for line in f_lines]
+
+    # Uložíme cache pro příští spuštění; obličeje s proměnlivým počtem
+    # vrcholů (seznam místo pole) do npz neukládáme
+    if isinstance(faces, np.ndarray):
+        np.savez(cache, v=vertices, f=faces)
+
+    return vertices, faces
+
+
+def fan_block(faces, face_ids):
+    """
+    Vějířově trianguluje blok obličejů s jednotným počtem vrcholů
+    jediným np.stack a zreplikuje k trojúhelníkům čísla zdrojových
+    obličejů. Vrací (trojúhelníky, čísla obličejů).
+    """
+    corners = faces.shape[1]
+    if corners == 3:
+        return faces.astype(np.uint32, copy=False), face_ids
+
+    # Vějíř (v0, vi, vi+1) pro všechny obličeje najednou:
+    # tři sloupcové výřezy poskládané do (M, corners-2, 3)
+    fan = np.stack([np.repeat(faces[:, :1], corners - 2, axis=1),
+                    faces[:, 1:-1],
+                    faces[:, 2:]], axis=2)
+    return (fan.reshape(-1, 3).astype(np.uint32, copy=False),
+            np.repeat(face_ids, corners - 2))
+
+
+if njit is not None:
+    @njit(cache=True)
+    def fan_triangulate(face_indices, face_offsets, out, out_ids):
+        """
+        JIT-kompilovaná vějířová triangulace smíšených obličejů nad
+        plochými poli: face_indices obsahuje indexy vrcholů všech
+        obličejů za sebou a face_offsets začátek každého obličeje.
+        Trojúhelníky a čísla zdrojových obličejů se zapisují do
+        předalokovaných polí out a out_ids.
+        """
+        idx = 0
+        for f in range(face_offsets.shape[0] - 1):
+            base = face_offsets[f]
+            corners = face_offsets[f + 1] - base
+            for i in range(1, corners - 1):
+                out[idx, 0] = face_indices[base]
+                out[idx, 1] = face_indices[base + i]
+                out[idx, 2] = face_indices[base + i + 1]
+                out_ids[idx] = f
+                idx += 1
+
+
+def triangulate_ragged_jit(faces):
+    """
+    Trianguluje smíšený seznam obličejů JIT-kompilovanou smyčkou:
+    seznam se rozbalí do plochých polí indexů a offsetů a fan_triangulate
+    zapíše trojúhelníky do předalokovaného výstupu. Na rozdíl od
+    seskupování podle arity zachovává původní pořadí obličejů.
+    Vrací (trojúhelníky, čísla obličejů).
+    """
+    lengths = np.fromiter((len(face) for face in faces), dtype=np.int64,
+                          count=len(faces))
+    face_offsets = np.zeros(len(faces) + 1, dtype=np.int64)
+    np.cumsum(lengths, out=face_offsets[1:])
+    face_indices = np.fromiter((v for face in faces for v in face),
+                               dtype=np.uint32, count=face_offsets[-1])
+
+    triangle_count = int(np.maximum(lengths - 2, 0).sum())
+    triangles = np.empty((triangle_count, 3), dtype=np.uint32)
+    triangle_ids = np.empty(triangle_count, dtype=np.int64)
+    fan_triangulate(face_indices, face_offsets, triangles, triangle_ids)
+    return triangles, triangle_ids
+
+
+def triangulate_faces(faces, return_face_ids=False):
+    """
+    Převede seznam obličejů (3 a více vrcholů) na pole trojúhelníků.
+    Obličeje s více než 3 vrcholy jsou rozděleny vějířovou strukturou (fan).
+    Pole s jednotným počtem vrcholů na obličej se triangulují hromadně;
+    smíšený seznam projde JIT-kompilovanou smyčkou (je-li k dispozici
+    Numba), jinak se rozdělí do skupin podle počtu vrcholů a každá
+    skupina se zpracuje hromadně.
+    Vrací pole indexů uint32 o tvaru (M, 3); s return_face_ids=True
+    navíc pole s číslem zdrojového obličeje každého trojúhelníku.
+    """
+    if isinstance(faces, np.ndarray):
+        triangles, triangle_ids = fan_block(
+            faces, np.arange(len(faces), dtype=np.int64))
+    elif njit is not None:
+        triangles, triangle_ids = triangulate_ragged_jit(faces)
+    else:
+        # Smíšené arity: seskupíme podle počtu vrcholů a trianguluje se
+        # po skupinách vektorizovanou cestou
+        buckets = {}
+        for face_id, face in enumerate(faces):
+            buckets.setdefault(len(face), []).append((face_id, face))
+        triangle_parts = []
+        id_parts = []
+        for bucket in buckets.values():
+            ids = np.array([face_id for face_id, _ in bucket], dtype=np.int64)
+            block = np.asarray([face for _, face in bucket], dtype=np.uint32)
+            triangles, triangle_ids = fan_block(block, ids)
+            triangle_parts.append(triangles)
+            id_parts.append(triangle_ids)
+        triangles = (np.concatenate(triangle_parts) if triangle_parts
+                     else np.empty((0, 3), dtype=np.uint32))
+        triangle_ids = (np.concatenate(id_parts) if id_parts
+                        else np.empty(0, dtype=np.int64))
+
+    if return_face_ids:
+        return triangles, triangle_ids
+    return triangles
+
+
+def spatial_sort(vertices, faces):
+    """
+    Seřadí vrcholy podél Mortonovy (Z-order) křivky jejich souřadnic
+    a přemapuje indexy obličejů. Prostorově blízké vrcholy tak skončí
+    blízko sebe i v paměti a trojúhelníky seřazené podle nové číselné
+    hodnoty indexů procházejí model po souvislých shlucích, což
+    zlepšuje využití cache line při čtení vrcholů.
+    Souřadnice se kvantizují na 20 bitů na osu a bity tří os se
+    prokládají SWAR posuny do jediného 64bitového klíče.
+    Vrací (seřazené vrcholy, přemapované obličeje).
+    """
+    BITS = 20
+
+    def spread(x):
+        # Roztáhne 20bitové číslo tak, aby mezi bity vznikly dvě mezery
+        x = (x | x << 32) & np.uint64(0x1F00000000FFFF)
+        x = (x | x << 16) & np.uint64(0x1F0000FF0000FF)
+        x = (x | x << 8) & np.uint64(0x100F00F00F00F00F)
+        x = (x | x << 4) & np.uint64(0x10C30C30C30C30C3)
+        x = (x | x << 2) & np.uint64(0x1249249249249249)
+        return x
+
+    vmin = vertices.min(axis=0)
+    vmax = vertices.max(axis=0)
+    extent = np.where(vmax > vmin, vmax - vmin, 1.0)
+    quantized = ((vertices - vmin) / extent * (2 ** BITS - 1)).astype(np.uint64)
+
+    keys = (spread(quantized[:, 0])
+            | spread(quantized[:, 1]) << np.uint64(1)
+            | spread(quantized[:, 2]) << np.uint64(2))
+
+    perm = np.argsort(keys)
+    inverse = np.empty(len(perm), dtype=np.uint32)
+    inverse[perm] = np.arange(len(perm), dtype=np.uint32)
+
+    if isinstance(faces, np.ndarray):
+        faces = inverse[faces]
+    else:
+        faces = [[int(inverse[v]) for v in face] for face in faces]
+    return vertices[perm], faces
+
+
+def reorder_indices(indices, vertex_count):
+    """
+    Přeuspořádá trojúhelníky Forsythovým lineárním algoritmem tak, aby
+    po sobě jdoucí trojúhelníky sdílely vrcholy čerstvě uložené
+    v post-transform cache GPU (velikost 32). GPU pak transformuje
+    každý vrchol méněkrát, což zvyšuje propustnost vertex shaderu.
+    Skóre vrcholu kombinuje pozici v cache s bonusem za nízkou valenci,
+    přesně podle Forsythovy heuristiky.
+    """
+    CACHE_SIZE = 32
+    CACHE_DECAY_POWER = 1.5
+    LAST_TRI_SCORE = 0.75
+    VALENCE_BOOST_SCALE = 2.0
+    VALENCE_BOOST_POWER = 0.5
+
+    triangle_count = len(indices)
+    if triangle_count == 0:
+        return indices
+
+    # Valence a seznam trojúhelníků pro každý vrchol
+    valence = [0] * vertex_count
+    vertex_triangles = [[] for _ in range(vertex_count)]
+    for t, tri in enumerate(indices.tolist()):
+        for v in tri:
+            valence[v] += 1
+            vertex_triangles[v].append(t)
+
+    def vertex_score(v, cache_pos):
+        if valence[v] == 0:
+            return -1.0
+        if cache_pos < 0:
+            score = 0.0
+        elif cache_pos < 3:
+            # Vrcholy z posledního trojúhelníku mají pevné skóre,
+            # aby se nepreferovaly dlouhé pásy
+            score = LAST_TRI_SCORE
+        else:
+            score = (1.0 - (cache_pos - 3) / (CACHE_SIZE - 3)) ** CACHE_DECAY_POWER
+        return score + VALENCE_BOOST_SCALE * valence[v] ** -VALENCE_BOOST_POWER
+
+    scores = [vertex_score(v, -1) for v in range(vertex_count)]
+    tris = indices.tolist()
+    tri_scores = [scores[a] + scores[b] + scores[c] for a, b, c in tris]
+    emitted = [False] * triangle_count
+
+    cache = []          # LRU cache vrcholů, nejnovější na začátku
+    output = []
+    cursor = 0          # postupový kurzor pro hledání dalšího trojúhelníku
+    best_tri = -1
+
+    for _ in range(triangle_count):
+        if best_tri < 0:
+            # Žádný kandidát v cache: vezmeme první nezpracovaný trojúhelník
+            while emitted[cursor]:
+                cursor += 1
+            best_tri = cursor
+
+        emitted[best_tri] = True
+        tri = tris[best_tri]
+        output.append(tri)
+
+        for v in tri:
+            valence[v] -= 1
+            vertex_triangles[v].remove(best_tri)
+
+        # Aktualizace LRU cache: vrcholy trojúhelníku na začátek
+        cache = list(tri) + [v for v in cache if v not in tri]
+        evicted = cache[CACHE_SIZE:]
+        cache = cache[:CACHE_SIZE]
+
+        # Přepočet skóre dotčených vrcholů a výběr dalšího trojúhelníku
+        for pos, v in enumerate(cache):
+            scores[v] = vertex_score(v, pos)
+        for v in evicted:
+            scores[v] = vertex_score(v, -1)
+
+        best_tri = -1
+        best_score = -1.0
+        for v in cache:
+            for t in vertex_triangles[v]:
+                a, b, c = tris[t]
+                tri_scores[t] = scores[a] + scores[b] + scores[c]
+                if tri_scores[t] > best_score:
+                    best_score = tri_scores[t]
+                    best_tri = t
+
+    return np.asarray(output, dtype=np.uint32)
+
+
+def reorder_vertices(vertices, indices):
+    """
+    Přeuspořádá vertex buffer podle pořadí prvního použití vrcholů
+    v (již optimalizovaném) index bufferu, takže GPU čte vrcholy
+    sekvenčně a lépe využije pre-transform cache line.
+    Vrací (nové vrcholy, přemapované indexy).
+    """
+    flat = indices.ravel()
+    # Vrcholy v pořadí prvního výskytu v index bufferu
+    _, first_use = np.unique(flat, return_index=True)
+    used = flat[np.sort(first_use)]
+    # Nepoužité vrcholy zařadíme na konec, aby se žádný neztratil
+    unused = np.setdiff1d(np.arange(len(vertices), dtype=flat.dtype), used,
+                          assume_unique=True)
+    perm = np.concatenate([used, unused])
+
+    inverse = np.empty(len(vertices), dtype=indices.dtype)
+    inverse[perm] = np.arange(len(vertices), dtype=indices.dtype)
+    return vertices[perm], inverse[indices]
+
+
+def frustum_planes(mvp):
+    """
+    Odvodí šest rovin pohledového jehlanu z řádkové matice MVP
+    (Gribbova-Hartmannova extrakce). Roviny jsou v prostoru, ve kterém
+    jsou souřadnice vrcholů před násobením MVP, tedy v kvantizovaném
+    prostoru modelu. Pro znaménkové testy není třeba je normalizovat.
+    """
+    return np.stack([
+        mvp[3] + mvp[0],   # levá
+        mvp[3] - mvp[0],   # pravá
+        mvp[3] + mvp[1],   # dolní
+        mvp[3] - mvp[1],   # horní
+        mvp[3] + mvp[2],   # blízká
+        mvp[3] - mvp[2],   # vzdálená
+    ])
+
+
+def visible_sub_meshes(sub_meshes, mvp):
+    """
+    Otestuje AABB všech prostorových bloků proti pohledovému jehlanu
+    a vrátí masku viditelných bloků. Pro každou rovinu se bere roh AABB
+    nejdál ve směru její normály (p-vrchol); blok je zahozen, jakmile
+    je tento roh za některou rovinou. Vše jde přes hrstku skalárních
+    součinů vektorizovaných přes bloky.
+    """
+    planes = frustum_planes(mvp)
+    normals = planes[:, :3]
+
+    # p-vrchol pro každou dvojici (rovina, blok): (6, K, 3)
+    p_vertex = np.where(normals[:, None, :] > 0,
+                        sub_meshes.aabb_max[None], sub_meshes.aabb_min[None])
+    distances = (p_vertex * normals[:, None, :]).sum(axis=2) + planes[:, 3:4]
+    return (distances >= 0).all(axis=0)
+
+
+def build_sub_meshes(indices, quantized):
+    """
+    Rozdělí index buffer na po sobě jdoucí prostorové bloky a spočítá
+    jejich AABB v kvantizovaném prostoru. Díky Mortonovu seřazení
+    procházejí trojúhelníky model po shlucích, takže i souvislé úseky
+    index bufferu pokrývají kompaktní oblasti prostoru. Bloky sdílejí
+    jeden index buffer a liší se jen offsetem a počtem indexů.
+    """
+    chunk_count = min(SUB_MESH_COUNT, len(indices))
+    if chunk_count < 2:
+        return None
+
+    offsets = []
+    counts = []
+    aabb_min = []
+    aabb_max = []
+    for chunk in np.array_split(np.arange(len(indices)), chunk_count):
+        block = indices[chunk]
+        corners = quantized[block.ravel()].astype(np.float32)
+        offsets.append(chunk[0] * 3)
+        counts.append(len(chunk) * 3)
+        aabb_min.append(corners.min(axis=0))
+        aabb_max.append(corners.max(axis=0))
+
+    return SubMeshes(np.asarray(offsets), np.asarray(counts),
+                     np.asarray(aabb_min), np.asarray(aabb_max))
+
+
+def quantize_positions(positions):
+    """
+    Kvantizuje souřadnice na int16: body se znormalizují do krychle
+    [-1, 1] podle AABB a uloží jako celá čísla -32767..32767 (6 bajtů
+    na vrchol místo 12, tedy poloviční šířka pásma při čtení vrcholů).
+    Vrací (kvantizovaná pole, posun, měřítko); osy s nulovým rozsahem
+    dostanou jednotkové měřítko.
+    """
+    vmin = positions.min(axis=0)
+    vmax = positions.max(axis=0)
+    bias = (vmin + vmax) / 2
+    scale = np.where(vmax > vmin, (vmax - vmin) / 2, 1.0).astype(np.float32)
+    quantized = np.round((positions - bias) / scale * 32767).astype(np.int16)
+    return quantized, bias, scale
+
+
+def compile_mesh(vertices, faces, colors="green"):
+    """
+    Nahraje model do GPU bufferů a zabalí je do VAO.
+    Data se nahrají jen hromadnými přenosy a vykreslení pak probíhá
+    jediným draw voláním, takže odpadají miliony volání Python->C
+    při sestavování modelu. VAO si nastavení bufferů zapamatuje, takže
+    každý snímek stačí jediné glBindVertexArray.
+
+    Režim colors="green" sestavuje indexovanou síť s jednotnou barvou:
+    vrcholy se prostorově seřadí podle Mortonovy křivky, trojúhelníky
+    projdou Forsythovou optimalizací pro vertex cache a vertex buffer
+    se přeuspořádá podle prvního použití.
+
+    Režim colors="palette" sestavuje ploché, neindexované trojúhelníky
+    s náhodnou barvou palety na obličej (barva se tak může lišit i na
+    obličejích sdílejících vrchol); pole barev se spočítá jedním
+    průchodem NumPy a nahraje jako druhý VBO.
+
+    Souřadnice jsou v obou režimech kvantizované na int16; původní
+    měřítko obnovuje modelová matice při vykreslení. Indexovaná síť se
+    navíc dělí na prostorové bloky pro frustum culling za běhu.
+    Vrací Model(vao, počet, posun, měřítko, indexed, barva, bloky).
+    """
+    verts = np.asarray(vertices, dtype=np.float32)
+
+    # Prostorové seřazení vrcholů podle Mortonovy křivky
+    verts, faces = spatial_sort(verts, faces)
+
+    if colors == "palette":
+        indices, face_ids = triangulate_faces(faces, return_face_ids=True)
+
+        # Jedna náhodná barva palety na obličej, zreplikovaná na tři
+        # vrcholy každého jeho trojúhelníku
+        face_colors = PALETTE[np.random.randint(0, len(PALETTE), size=len(faces))]
+        vertex_colors = np.repeat(face_colors[face_ids], 3, axis=0)
+
+        # Rozbalení na ploché trojúhelníky bez indexace
+        positions = verts[indices].reshape(-1, 3)
+        quantized, bias, scale = quantize_positions(positions)
+
+        vao = glGenVertexArrays(1)
+        glBindVertexArray(vao)
+
+        vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, vbo)
+        glBufferData(GL_ARRAY_BUFFER, quantized.nbytes, quantized, GL_STATIC_DRAW)
+        glVertexAttribPointer(0, 3, GL_SHORT, GL_FALSE, 0, None)
+        glEnableVertexAttribArray(0)
+
+        color_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, color_vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertex_colors.nbytes, vertex_colors,
+                     GL_STATIC_DRAW)
+        glVertexAttribPointer(1, 3, GL_FLOAT, GL_FALSE, 0, None)
+        glEnableVertexAttribArray(1)
+
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+        return Model(vao, len(positions), bias, scale, indexed=False,
+                     color=None, sub_meshes=None)
+
+    # Indexovaná síť: trojúhelníky seřadíme podle nejnižšího indexu, aby
+    # i proud indexů sledoval prostorové shluky, a teprve nad ním
+    # spustíme Forsythovu optimalizaci
+    indices = triangulate_faces(faces)
+    indices = indices[np.argsort(indices.min(axis=1), kind="stable")]
+
+    # Jednorázová optimalizace pořadí pro vertex cache GPU
+    indices = reorder_indices(indices, len(verts))
+    verts, indices = reorder_vertices(verts, indices)
+
+    quantized, bias, scale = quantize_positions(verts)
+
+    # Rozdělení na prostorové bloky, které se za běhu testují proti
+    # pohledovému jehlanu; bloky mimo záběr se vůbec nekreslí
+    sub_meshes = build_sub_meshes(indices, quantized)
+
+    # VAO: snímek stavu vazeb bufferů, který se při vykreslení jen obnoví
+    vao = glGenVertexArrays(1)
+    glBindVertexArray(vao)
+
+    # Vertex buffer: kvantizované souřadnice v jednom souvislém bloku.
+    # GL_STATIC_DRAW říká ovladači, že se obsah po nahrání už nemění,
+    # takže buffer může zůstat ve video paměti; případné budoucí dílčí
+    # úpravy musí jít přes glBufferSubData(target, offset, size, data),
+    # nový glBufferData by buffer zbytečně realokoval
+    vbo = glGenBuffers(1)
+    glBindBuffer(GL_ARRAY_BUFFER, vbo)
+    glBufferData(GL_ARRAY_BUFFER, quantized.nbytes, quantized, GL_STATIC_DRAW)
+
+    # Index buffer: trojúhelníky jako trojice indexů do vertex bufferu
+    ibo = glGenBuffers(1)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, ibo)
+    glBufferData(GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL_STATIC_DRAW)
+
+    # Stav uložený ve VAO: atribut 0 (position) čte kvantizované shorty
+    glVertexAttribPointer(0, 3, GL_SHORT, GL_FALSE, 0, None)
+    glEnableVertexAttribArray(0)
+
+    glBindVertexArray(0)
+    glBindBuffer(GL_ARRAY_BUFFER, 0)
+    glBindBuffer(GL_ELEMENT_ARRAY_BUFFER, 0)
+
+    return Model(vao, indices.size, bias, scale, indexed=True, color=GREEN,
+                 sub_meshes=sub_meshes)
+
+
+def update_camera(camera_pos, key_map, speed=0.5):
+    """
+    Aktualizuje pozici kamery podle kláves přiřazených akcím v key_map:
+    - forward/back posouvá kameru ke středu a od středu
+    - up/down posouvá kameru podél osy Y
+    - left/right posouvá kameru podél osy X
+    Akce s klávesou None se ignorují. Kamera se neustále dívá na střed
+    (0, 0, 0). Pozice kamery je malé pole NumPy a aktualizuje se na
+    místě, takže se každý snímek nealokují nové seznamy.
+
+    Parametry:
+    - camera_pos: aktuální pozice kamery jako np.ndarray o 3 prvcích
+    - key_map: rozložení kláves jako CameraKeys
+    - speed: rychlost pohybu kamery
+    Vrací (camera_pos, příznak pohybu).
+    """
+    keys = pygame.key.get_pressed()
+
+    # Všechny příznaky přečteme z proxy objektu najednou do lokálních
+    # proměnných, místo opakovaného indexování na každém řádku níže
+    forward = key_map.forward is not None and keys[key_map.forward]
+    back = key_map.back is not None and keys[key_map.back]
+    rise = key_map.up is not None and keys[key_map.up]
+    sink = key_map.down is not None and keys[key_map.down]
+    left = key_map.left is not None and keys[key_map.left]
+    right = key_map.right is not None and keys[key_map.right]
+
+    # Příznak pohybu: když není stisknuta žádná pohybová klávesa,
+    # kamera se nezměnila a volající může snímek přeskočit
+    if not (forward or back or rise or sink or left or right):
+        return camera_pos, False
+
+    # Jednotkový vektor směrem ke středu; jedna převrácená hodnota délky
+    # místo tří dělení po složkách
+    length_sq = float(camera_pos.dot(camera_pos))
+    if length_sq > 0.0:
+        norm_dir = camera_pos * (-1.0 / math.sqrt(length_sq))
+    else:
+        norm_dir = np.zeros(3, dtype=camera_pos.dtype)
+
+    # Pohyb vpřed a vzad podél směru ke středu
+    if forward:
+        camera_pos += norm_dir * speed
+    if back:
+        camera_pos -= norm_dir * speed
+
+    # Pohyb nahoru a dolů podél osy Y
+    if rise:
+        camera_pos[1] += speed
+    if sink:
+        camera_pos[1] -= speed
+
+    # Pohyb doleva a doprava podél osy X
+    if left:
+        camera_pos[0] += speed
+    if right:
+        camera_pos[0] -= speed
+
+    return camera_pos, True
+
+
+# Cache pro vykreslování textu: font se načítá jen jednou (SysFont jinak
+# při každém volání znovu otevírá soubor s písmem) a vyrenderované bitmapy
+# se uchovávají podle řetězce. Do GPU se nahrávají přes jedinou sdílenou
+# texturu: alokuje se jednou a při změně textu se aktualizuje pomocí
+# glTexSubImage2D, takže ovladač texturu nerealokuje
+_font = None
+_text_cache = {}
+_text_texture = None
+_text_texture_size = (0, 0)
+_text_last_key = None
+
+
+def render_text(x, y, text_string, font_name="Arial", font_size=18):
+    """
+    Vykreslí text pomocí OpenGL jako texturovaný obdélník.
+    Text je zobrazen bílou barvou na černém pozadí.
+    Bitmapa textu se nahraje do textury jen při změně řetězce; samotné
+    vykreslení je pak jedna vazba textury a čtyři vrcholy, místo pomalého
+    streamování pixelů přes glDrawPixels každý snímek.
+
+    Parametry:
+    - x, y: pozice v okně (v pixelech; počátek v levém dolním rohu)
+    - text_string: textový řetězec k zobrazení
+    - font_name, font_size: vlastnosti písma použitého pro vykreslení textu
+    """
+    global _font, _text_texture, _text_texture_size, _text_last_key
+    text_color = (255, 255, 255)         # Bílá barva textu
+    background_color = (0, 0, 0)           # Černé pozadí
+
+    if _font is None:
+        _font = pygame.font.SysFont(font_name, font_size)
+
+    key = (text_string, font_name, font_size)
+    if key not in _text_cache:
+        # Ochrana proti neomezenému růstu cache při stále novém textu
+        if len(_text_cache) > 256:
+            _text_cache.clear()
+        text_surface = _font.render(text_string, True, text_color, background_color)
+        text_data = pygame.image.tostring(text_surface, "RGBA", True)
+        _text_cache[key] = (text_data, text_surface.get_size())
+    text_data, (width, height) = _text_cache[key]
+
+    if _text_texture is None:
+        _text_texture = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, _text_texture)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameteri(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+    else:
+        glBindTexture(GL_TEXTURE_2D, _text_texture)
+
+    texture_width, texture_height = _text_texture_size
+    if width > texture_width or height > texture_height:
+        # Jednorázová (re)alokace úložiště textury; roste jen výjimečně,
+        # když se objeví delší text než dosud
+        texture_width = max(texture_width, width)
+        texture_height = max(texture_height, height)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, texture_width, texture_height,
+                     0, GL_RGBA, GL_UNSIGNED_BYTE, None)
+        _text_texture_size = (texture_width, texture_height)
+        _text_last_key = None
+
+    if key != _text_last_key:
+        # Změna textu: přepíšeme jen dotčenou oblast, bez realokace
+        glTexSubImage2D(GL_TEXTURE_2D, 0, 0, 0, width, height,
+                        GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+        _text_last_key = key
+
+    display_width, display_height = pygame.display.get_surface().get_size()
+
+    # Přepneme do ortografické projekce 1:1 s pixely okna; matici
+    # spočítáme v NumPy a nahrajeme jedním glLoadMatrixf (transpozice,
+    # protože OpenGL očekává sloupcovou matici)
+    glMatrixMode(GL_PROJECTION)
+    glPushMatrix()
+    glLoadMatrixf(ortho_matrix(display_width, display_height).T)
+    glMatrixMode(GL_MODELVIEW)
+    glPushMatrix()
+    glLoadIdentity()
+
+    # HUD se kreslí vyplněný, bez depth testu a s texturou
+    glPushAttrib(GL_ENABLE_BIT | GL_POLYGON_BIT)
+    glDisable(GL_DEPTH_TEST)
+    glPolygonMode(GL_FRONT_AND_BACK, GL_FILL)
+    glEnable(GL_TEXTURE_2D)
+    glBindTexture(GL_TEXTURE_2D, _text_texture)
+    glColor3f(1.0, 1.0, 1.0)
+
+    # Texturovací souřadnice pokrývají jen oblast aktuálního textu,
+    # textura může být alokovaná větší
+    s = width / _text_texture_size[0]
+    t = height / _text_texture_size[1]
+
+    glBegin(GL_QUADS)
+    glTexCoord2f(0, 0)
+    glVertex2f(x, y)
+    glTexCoord2f(s, 0)
+    glVertex2f(x + width, y)
+    glTexCoord2f(s, t)
+    glVertex2f(x + width, y + height)
+    glTexCoord2f(0, t)
+    glVertex2f(x, y + height)
+    glEnd()
+
+    glPopAttrib()
+    glPopMatrix()
+    glMatrixMode(GL_PROJECTION)
+    glPopMatrix()
+    glMatrixMode(GL_MODELVIEW)
+
+
+def render_scene(model, shader, mvp):
+    """
+    Vykreslí 3D scénu nad GPU buffery modelu. Veškeré nastavení bufferů
+    obnoví jediné glBindVertexArray; celá transformace (dekvantizace,
+    kamera i projekce) je složena do matice mvp spočítané na CPU
+    a nahrané jako jediný uniform. Síť rozdělená na prostorové bloky
+    se nejprve ořízne proti pohledovému jehlanu a kreslí se jen
+    viditelné bloky; ostatní sítě jdou jedním draw voláním.
+    """
+    glUseProgram(shader.program)
+    # GL_TRUE: NumPy matice je řádková, OpenGL očekává sloupcovou
+    glUniformMatrix4fv(shader.mvp_loc, 1, GL_TRUE, mvp)
+
+    if model.color is not None:
+        # Jednotná barva sítě: konstantní hodnota atributu color
+        # (pole barev je ve VAO vypnuté)
+        glVertexAttrib3f(1, *model.color)
+
+    glBindVertexArray(model.vao)
+    if not model.indexed:
+        glDrawArrays(GL_TRIANGLES, 0, model.count)
+    elif model.sub_meshes is None:
+        glDrawElements(GL_TRIANGLES, model.count, GL_UNSIGNED_INT, None)
+    else:
+        # Frustum culling: kreslí se jen bloky, jejichž AABB zasahuje
+        # do záběru; offset je v bajtech do sdíleného index bufferu
+        visible = visible_sub_meshes(model.sub_meshes, mvp)
+        for offset, count in zip(model.sub_meshes.offsets[visible],
+                                 model.sub_meshes.counts[visible]):
+            glDrawElements(GL_TRIANGLES, int(count), GL_UNSIGNED_INT,
+                           ctypes.c_void_p(int(offset) * 4))
+    glBindVertexArray(0)
+    glUseProgram(0)
+
+
+def render_camera_coordinates(camera_pos, display_size):
+    """
+    Vykreslí aktuální souřadnice kamery jako textový overlay v levém horním rohu okna.
+    Souřadnice zaokrouhlujeme na jedno desetinné místo, aby se text mezi
+    snímky měnil co nejméně a cache v render_text se trefovala.
+    """
+    text = f"Camera: x={camera_pos[0]:.1f}, y={camera_pos[1]:.1f}, z={camera_pos[2]:.1f}"
+    render_text(10, display_size[1] - 30, text)
+
+
+def initialize(render_mode="wire", fov=45, near_val=0.1, far_val=500.0):
+    """
+    Inicializuje Pygame, OpenGL a nastaví perspektivu.
+    Nastavení OpenGL zahrnuje povolení depth testu a back face culling,
+    což umožňuje vykreslit pouze viditelné části modelu. Veškeré
+    jednorázové nastavení GL (projekce, režim vyplňování polygonů,
+    shader) se provádí právě zde.
+
+    Parametry:
+    - render_mode: "wire" pro drátový model, "fill" pro vyplněné plochy
+    - fov, near_val, far_val: parametry perspektivní projekce
+    """
+    pygame.init()
+    display_size = (800, 600)
+    pygame.display.set_mode(display_size, DOUBLEBUF | OPENGL)
+    pygame.font.init()  # Inicializace písma pro vykreslování textu
+
+    # Povolení depth testu, aby OpenGL dokázalo správně řešit překrývání objektů
+    glEnable(GL_DEPTH_TEST)
+    glDepthFunc(GL_LESS)
+
+    # Povolení culling (skrytí zadních ploch modelu)
+    glEnable(GL_CULL_FACE)
+    glCullFace(GL_BACK)
+
+    # Nastavení clear color na tmavě šedou, která zlepší kontrast vykresleného modelu
+    glClearColor(0.1, 0.1, 0.1, 1.0)
+
+    # Nastavení viewportu odpovídajícího velikosti okna
+    glViewport(0, 0, display_size[0], display_size[1])
+
+    # Nastavíme projekční matici pro perspektivní zobrazení; spočítá se
+    # v NumPy a nahraje jediným glLoadMatrixf místo volání GLU
+    projection = perspective_matrix(fov, display_size[0] / display_size[1],
+                                    near_val, far_val)
+    glMatrixMode(GL_PROJECTION)
+    glLoadMatrixf(projection.T)
+    glMatrixMode(GL_MODELVIEW)
+
+    # Režim vykreslování se za běhu nemění, proto patří sem a ne do
+    # hlavní smyčky
+    glPolygonMode(GL_FRONT_AND_BACK,
+                  GL_LINE if render_mode == "wire" else GL_FILL)
+
+    # Shaderový program pro vykreslení modelu se sestaví jen jednou
+    shader = create_shader()
+
+    return display_size, shader, projection
+
+
+def run(model_path="model.obj", render_mode="wire", colors="green",
+        key_map=KEYS_WASD_QE, camera_start=(0, 0, 50), fov=45,
+        near_val=0.1, far_val=500.0, speed=0.5):
+    """
+    Spustí prohlížeč modelu:
+    - Inicializuje prostředí a OpenGL nastavení.
+    - Načte 3D model ze souboru OBJ a nahraje ho do GPU bufferů.
+    - Spouští hlavní smyčku, kde aktualizuje pozici kamery,
+      vykresluje scénu a zobrazuje text s informacemi o kameře.
+
+    Parametry:
+    - model_path: cesta k souboru OBJ
+    - render_mode: "wire" (drátový model) nebo "fill" (vyplněné plochy)
+    - colors: "green" (jednotná zelená) nebo "palette" (náhodné barvy
+      palety po obličejích)
+    - key_map: rozložení kláves kamery (KEYS_WASD_QE nebo KEYS_WASD)
+    - camera_start: počáteční pozice kamery
+    - fov, near_val, far_val: parametry perspektivní projekce
+    - speed: rychlost pohybu kamery
+    """
+    display_size, shader, projection = initialize(render_mode, fov,
+                                                  near_val, far_val)
+
+    # Počáteční pozice kamery
+    camera_pos = np.array(camera_start, dtype=np.float32)
+
+    # Načteme model z OBJ souboru a nahrajeme ho do GPU bufferů
+    vertices, faces = load_obj(model_path)
+    model = compile_mesh(vertices, faces, colors=colors)
+    model_mat = dequantize_matrix(model)
+
+    # Hodiny pro řízení snímkové frekvence
+    clock = pygame.time.Clock()
+    running = True
+    redraw = True  # první snímek vykreslíme vždy
+    while running:
+        # Smyčka zpracování událostí, např. zavření okna
+        events = pygame.event.get()
+        for event in events:
+            if event.type == pygame.QUIT:
+                running = False
+
+        # Aktualizace pozice kamery podle stisknutých kláves
+        camera_pos, moved = update_camera(camera_pos, key_map, speed=speed)
+
+        # Překreslujeme jen při pohybu kamery nebo při jakékoli události
+        # (změna velikosti či odkrytí okna); jinak se snímek přeskočí
+        # a GPU i sběrnice zůstanou v klidu
+        if moved or events:
+            redraw = True
+        if not redraw:
+            clock.tick(60)
+            continue
+
+        # Vyčistíme color a depth buffer, aby se zobrazil nový snímek
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+
+        # Celá transformace se složí na CPU do jediné matice:
+        # projekce * kamera (pohled na střed scény) * dekvantizace modelu
+        mvp = projection @ look_at_matrix(camera_pos) @ model_mat
+
+        # Vykreslíme model a text s informacemi o kameře
+        render_scene(model, shader, mvp)
+        render_camera_coordinates(camera_pos, display_size)
+
+        # Vykreslíme obsah na obrazovku a omezíme snímkovou frekvenci na 60 FPS
+        pygame.display.flip()
+        redraw = False
+        clock.tick(60)
+
+    pygame.quit()